@@ -34,6 +34,8 @@ def oneOf_a_in_b(a, b):
 def recursiveFindFiles( top, extensions, dirBlacklist, includePaths ):
     result = []
     for (dirpath, dirnames, filenames) in os.walk(top):
+        # prune blacklisted directories so that os.walk doesn't descend into them
+        dirnames[:] = [ d for d in dirnames if not oneOf_a_in_b(dirBlacklist, os.path.join(dirpath, d)) ]
         if not oneOf_a_in_b(dirBlacklist, dirpath):
             for f in filenames:
                 if os.path.splitext(f)[1] in extensions:
@@ -52,7 +54,7 @@ def doxygenHtmlDocFileName( sourceFile ):
 
 sourceFiles = recursiveFindFiles( os.path.join(paRootDirectory,'src'), [ '.c', '.h', '.cpp' ], ['.svn', 'mingw-include'], True );
 sourceFiles += recursiveFindFiles( os.path.join(paRootDirectory,'include'), [ '.c', '.h', '.cpp' ], ['.svn'], True );
-docFiles = recursiveFindFiles( paHtmlDocDirectory, [ '.html' ], ['.svn'], False );
+docFiles = set( recursiveFindFiles( paHtmlDocDirectory, [ '.html' ], ['.svn'], False ) );
 
 
 